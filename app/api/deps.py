@@ -1,6 +1,6 @@
 from collections.abc import Generator
 
-from fastapi import Header, HTTPException, status
+from fastapi import Depends, Header, HTTPException, status
 from sqlalchemy.orm import Session
 
 from ..core.config import API_KEY, API_KEY_HEADER_NAME
@@ -19,6 +19,10 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+# One shared Depends(get_db) marker for route signatures: `db: Session = DB`
+DB = Depends(get_db)
+
+
 def verify_api_key(x_api_key: str = Header("", alias=API_KEY_HEADER_NAME)) -> None:
     """
     Simple API key check using the X-API-Key header.
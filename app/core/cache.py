@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from fastapi import Request, Response
+
+from .config import RESPONSE_CACHE_MAX_ENTRIES, RESPONSE_CACHE_TTL_SECONDS
+from .responses import json_response
+
+
+class ResponseCache:
+    """
+    In-process TTL cache of serialised GET responses, keyed by path and query.
+
+    Entries hold the final JSON bytes, so a hit skips the database and
+    serialisation entirely. Write endpoints call clear() after committing.
+    clear() also bumps a generation counter: readers capture it before
+    querying, and set() drops a body computed before the latest clear(),
+    so a read that raced a write can't re-cache stale data.
+    Each worker process has its own cache, so with several workers a write
+    made through one of them is seen by the others once the TTL expires.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int) -> None:
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, str | bytes]] = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(request: Request) -> str:
+        return f"{request.url.path}?{request.url.query}"
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, key: str) -> Optional[str | bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, content = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return content
+
+    def set(self, key: str, content: str | bytes, generation: int) -> None:
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = (time.monotonic() + self._ttl, content)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+response_cache = ResponseCache(RESPONSE_CACHE_TTL_SECONDS, RESPONSE_CACHE_MAX_ENTRIES)
+
+
+def cached_json_response(key: str, content: str | bytes, generation: int) -> Response:
+    """
+    Store serialised JSON in the response cache and return it.
+
+    generation is response_cache.generation as read before the database
+    query that produced content.
+    """
+    response_cache.set(key, content, generation)
+    return json_response(content)
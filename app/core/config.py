@@ -1,4 +1,4 @@
-from typing import Final, Set
+from typing import Final
 import os
 
 APP_NAME: Final[str] = "Movies API"
@@ -6,12 +6,30 @@ APP_NAME: Final[str] = "Movies API"
 # SQLite database in the project root by default
 DATABASE_URL: Final[str] = "sqlite:///./movies.db"
 
+# Connection pool settings. Connections are kept open between requests so
+# each one's SQLite page cache survives instead of being rebuilt on reconnect.
+# Sync endpoints run on FastAPI's threadpool (40 threads by default), so the
+# pool can hand every worker thread a connection instead of making it queue;
+# WAL mode lets those readers run concurrently.
+DB_POOL_SIZE: Final[int] = 20
+DB_MAX_OVERFLOW: Final[int] = 20
+DB_POOL_RECYCLE_SECONDS: Final[int] = 3600
+
+# Create missing tables/indexes when the app starts. Set MOVIES_INIT_DB=0 for
+# multi-worker deployments and run `python -m app.utils.init_db` once instead.
+INIT_DB_ON_STARTUP: Final[bool] = os.getenv("MOVIES_INIT_DB", "1") == "1"
+
 # Pagination defaults
 DEFAULT_LIMIT: Final[int] = 20
 MAX_LIMIT: Final[int] = 100
 
-# Allowed movie status values (normalised to lowercase)
-MOVIE_STATUS_VALUES: Final[Set[str]] = {"released", "not released"}
+# How long the health check may report a cached movie count
+HEALTH_COUNT_TTL_SECONDS: Final[int] = 30
+
+# In-process cache of GET responses for the read-mostly movie/list endpoints.
+# Cleared on every write; the TTL bounds staleness across worker processes.
+RESPONSE_CACHE_TTL_SECONDS: Final[int] = 30
+RESPONSE_CACHE_MAX_ENTRIES: Final[int] = 1024
 
 
 # Simple API key authentication
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from fastapi import Response, status
+from fastapi.responses import JSONResponse
+
+
+def json_response(content: str | bytes, status_code: int = 200) -> Response:
+    """Wrap already-serialised JSON in a Response."""
+    return Response(
+        content=content, status_code=status_code, media_type="application/json"
+    )
+
+
+def not_found(detail: str) -> JSONResponse:
+    """
+    Build a 404 response with the same body as HTTPException(404, detail).
+
+    Returned directly from handlers on misses, so frequent not-found lookups
+    skip raising and catching an exception in the middleware stack.
+    """
+    return JSONResponse(
+        status_code=status.HTTP_404_NOT_FOUND, content={"detail": detail}
+    )
@@ -1,14 +1,59 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple
-
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    Select,
+    bindparam,
+    delete,
+    func,
+    literal,
+    select,
+    text,
+    union_all,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, load_only
 
 from ..core.config import MAX_LIMIT
-from ..models.movie import Movie
+from ..models.movie import (
+    MOVIES_FTS_REBUILD,
+    Genre,
+    Keyword,
+    Movie,
+    MovieGenre,
+    MovieKeyword,
+    movies_fts,
+)
 from ..schemas.movie import GenreStats, MovieCreate, MovieUpdate, SimilarMovie
 
+# Title lookups are built once and reused with bound parameters, so each call
+# skips statement construction and hits SQLAlchemy's compiled-SQL cache directly.
+# The explicit COLLATE keeps equality case-insensitive on databases created
+# before the column itself was declared NOCASE; newer ones still use the index.
+_TITLE_EQUALS_STMT = select(Movie).where(
+    Movie.title.collate("NOCASE") == bindparam("title")
+)
+_TITLE_CONTAINS_STMT = select(Movie).where(
+    Movie.id.in_(select(movies_fts.c.rowid).where(movies_fts.c.title.like(bindparam("pattern"))))
+)
+
+
+def _title_contains(title: str) -> ColumnElement[bool]:
+    """
+    Case-insensitive substring match on title, answered by the trigram index.
+
+    SQLite's LIKE is already case-insensitive for ASCII, matching the
+    lower(...) LIKE lower(...) that ilike() would produce, but unlike that
+    form it can be served by the movies_fts table.
+    """
+    return Movie.id.in_(
+        select(movies_fts.c.rowid).where(movies_fts.c.title.like(f"%{title}%"))
+    )
+
 
 def get_movies_by_title(
     db: Session,
@@ -22,12 +67,10 @@ def get_movies_by_title(
     If exact=False, matches titles containing the text (case-insensitive).
     """
     if exact:
-        query = select(Movie).where(Movie.title.ilike(title))
+        # NOCASE comparison: case-insensitive, and indexed on current schemas
+        result = db.execute(_TITLE_EQUALS_STMT, {"title": title})
     else:
-        pattern = f"%{title}%"
-        query = select(Movie).where(Movie.title.ilike(pattern))
-    
-    result = db.execute(query)
+        result = db.execute(_TITLE_CONTAINS_STMT, {"pattern": f"%{title}%"})
     return list(result.scalars().all())
 
 
@@ -36,9 +79,47 @@ def get_movie_by_title(db: Session, title: str) -> Optional[Movie]:
     Return the first movie whose title contains the given text (case-insensitive).
     Used internally for similarity searches.
     """
-    pattern = f"%{title}%"
-    stmt = select(Movie).where(Movie.title.ilike(pattern))
-    return db.execute(stmt).scalars().first()
+    return db.execute(_TITLE_CONTAINS_STMT, {"pattern": f"%{title}%"}).scalars().first()
+
+
+def _count(db: Session, filters: List[ColumnElement[bool]]) -> int:
+    """
+    Count movies matching the filters with a plain SELECT COUNT(*) ... WHERE,
+    so SQLite can use the same indexes as the main query instead of scanning
+    a materialised subquery.
+    """
+    return db.scalar(select(func.count()).select_from(Movie).where(*filters)) or 0
+
+
+def _fetch_page(db: Session, query: Select, limit: int) -> Tuple[List[Movie], bool]:
+    """
+    Fetch up to `limit` movies, over-fetching one row to tell whether more exist.
+    """
+    rows = list(db.execute(query.limit(limit + 1)).scalars().all())
+    return rows[:limit], len(rows) > limit
+
+
+def _movie_filters(
+    *,
+    title: Optional[str],
+    genre: Optional[str],
+    adult: Optional[bool],
+    status: Optional[str],
+    min_vote_average: Optional[float],
+) -> List[ColumnElement[bool]]:
+    """Build the WHERE conditions shared by the movie listing queries."""
+    filters: List[ColumnElement[bool]] = []
+    if title:
+        filters.append(_title_contains(title))
+    if genre:
+        filters.append(Movie.genres_rel.any(Genre.name == genre))
+    if adult is not None:
+        filters.append(Movie.adult.is_(adult))
+    if status:
+        filters.append(Movie.status == status)
+    if min_vote_average is not None:
+        filters.append(Movie.vote_average >= min_vote_average)
+    return filters
 
 
 def get_movies(
@@ -51,37 +132,128 @@ def get_movies(
     adult: Optional[bool] = None,
     status: Optional[str] = None,
     min_vote_average: Optional[float] = None,
-) -> Tuple[List[Movie], int]:
+    after_id: Optional[int] = None,
+    include_total: bool = False,
+) -> Tuple[List[Movie], Optional[int], bool]:
     """
-    Return a list of movies and the total count, applying pagination and filters.
+    Return a page of movies, the total count and whether more rows follow,
+    applying pagination and filters.
+
+    Only the columns needed for MovieSummary are loaded; the large text
+    columns (overview, keywords, ...) are never read for listings.
+
+    The total requires a separate COUNT query, so it is only computed when
+    include_total=True and is None otherwise.
+
+    Results are ordered by id. If after_id is given, keyset pagination is used
+    (WHERE id > after_id) and skip is ignored, so deep pages do not pay the
+    OFFSET rescan cost.
+
+    status is compared as given, so callers pass the canonical lowercase value.
     """
     if limit > MAX_LIMIT:
         limit = MAX_LIMIT
 
-    query = select(Movie)
+    filters = _movie_filters(
+        title=title,
+        genre=genre,
+        adult=adult,
+        status=status,
+        min_vote_average=min_vote_average,
+    )
+    total = _count(db, filters) if include_total else None
 
-    if title:
-        query = query.where(Movie.title.ilike(f"%{title}%"))
-    if genre:
-        # Genre is stored as comma-separated string, e.g. "Action, Drama"
-        query = query.where(Movie.genres.ilike(f"%{genre}%"))
-    if adult is not None:
-        query = query.where(Movie.adult.is_(adult))
-    if status:
-        # status is already normalised by Pydantic, but normalise again defensively
-        query = query.where(Movie.status == status.strip().lower())
-    if min_vote_average is not None:
-        query = query.where(Movie.vote_average >= min_vote_average)
+    query = (
+        select(Movie)
+        .options(
+            load_only(
+                Movie.id,
+                Movie.title,
+                Movie.vote_average,
+                Movie.release_date,
+                Movie.poster_path,
+            )
+        )
+        .where(*filters)
+    )
+
+    if after_id is not None:
+        # Seek past the cursor using the primary key index
+        query = query.where(Movie.id > after_id)
+    else:
+        query = query.offset(skip)
 
-    total = db.scalar(select(func.count()).select_from(query.subquery())) or 0
+    movies, has_more = _fetch_page(db, query.order_by(Movie.id), limit)
+    return movies, total, has_more
 
-    result = db.execute(query.offset(skip).limit(limit))
-    movies = list(result.scalars().all())
-    return movies, total
+
+def stream_movies(
+    db: Session,
+    *,
+    title: Optional[str] = None,
+    genre: Optional[str] = None,
+    adult: Optional[bool] = None,
+    status: Optional[str] = None,
+    min_vote_average: Optional[float] = None,
+    after_id: Optional[int] = None,
+    batch_size: int = 200,
+) -> Iterator[Row]:
+    """
+    Yield summary rows for every movie matching the filters, ordered by id.
+
+    Unlike get_movies there is no page limit: rows are fetched from the cursor
+    batch_size at a time as the caller consumes them, and plain column rows
+    are used so nothing accumulates in the session's identity map.
+    """
+    filters = _movie_filters(
+        title=title,
+        genre=genre,
+        adult=adult,
+        status=status,
+        min_vote_average=min_vote_average,
+    )
+    if after_id is not None:
+        filters.append(Movie.id > after_id)
+
+    stmt = (
+        select(
+            Movie.id,
+            Movie.title,
+            Movie.vote_average,
+            Movie.release_date,
+            Movie.poster_path,
+        )
+        .where(*filters)
+        .order_by(Movie.id)
+        .execution_options(yield_per=batch_size)
+    )
+    yield from db.execute(stmt)
+
+
+def _get_or_create_tokens(db: Session, model, names: frozenset[str]) -> list:
+    """Return Genre/Keyword rows for the given names, creating any missing ones."""
+    if not names:
+        return []
+    existing = {
+        t.name: t for t in db.execute(select(model).where(model.name.in_(names))).scalars()
+    }
+    for name in names - existing.keys():
+        existing[name] = model(name=name)
+        db.add(existing[name])
+    return [existing[name] for name in sorted(names)]
+
+
+def _sync_movie_tokens(db: Session, movie: Movie) -> None:
+    """Mirror the comma-separated genres/keywords strings into the join tables."""
+    movie.genres_rel = _get_or_create_tokens(db, Genre, _split_tokens(movie.genres))
+    movie.keywords_rel = _get_or_create_tokens(
+        db, Keyword, _split_tokens(movie.keywords)
+    )
 
 
 def create_movie(db: Session, movie_in: MovieCreate) -> Movie:
-    movie = Movie(**movie_in.dict())
+    movie = Movie(**movie_in.model_dump())
+    _sync_movie_tokens(db, movie)
     db.add(movie)
     db.commit()
     db.refresh(movie)
@@ -89,9 +261,11 @@ def create_movie(db: Session, movie_in: MovieCreate) -> Movie:
 
 
 def update_movie(db: Session, db_movie: Movie, movie_in: MovieUpdate) -> Movie:
-    data = movie_in.dict(exclude_unset=True)
+    data = movie_in.model_dump(exclude_unset=True)
     for field, value in data.items():
         setattr(db_movie, field, value)
+    if "genres" in data or "keywords" in data:
+        _sync_movie_tokens(db, db_movie)
     db.add(db_movie)
     db.commit()
     db.refresh(db_movie)
@@ -104,21 +278,22 @@ def get_movies_by_genre(
     *,
     skip: int = 0,
     limit: int = 20,
-) -> Tuple[List[Movie], int]:
+    include_total: bool = False,
+) -> Tuple[List[Movie], Optional[int], bool]:
     """
     Return movies filtered by genre.
-    Genre matching is case-insensitive and checks if genre appears in comma-separated genres string.
+    Genre matching is an exact name lookup in the normalised genres table.
     """
     if limit > MAX_LIMIT:
         limit = MAX_LIMIT
 
-    query = select(Movie).where(Movie.genres.ilike(f"%{genre}%"))
-    
-    total = db.scalar(select(func.count()).select_from(query.subquery())) or 0
-    
-    result = db.execute(query.offset(skip).limit(limit))
-    movies = list(result.scalars().all())
-    return movies, total
+    filters = [Movie.genres_rel.any(Genre.name == genre)]
+
+    total = _count(db, filters) if include_total else None
+
+    query = select(Movie).where(*filters)
+    movies, has_more = _fetch_page(db, query.offset(skip), limit)
+    return movies, total, has_more
 
 
 def get_movies_by_rating(
@@ -128,7 +303,8 @@ def get_movies_by_rating(
     max_rating: Optional[float] = None,
     skip: int = 0,
     limit: int = 20,
-) -> Tuple[List[Movie], int]:
+    include_total: bool = False,
+) -> Tuple[List[Movie], Optional[int], bool]:
     """
     Return movies filtered by rating range (vote_average).
     Results are sorted by rating descending (highest rated first).
@@ -136,27 +312,130 @@ def get_movies_by_rating(
     if limit > MAX_LIMIT:
         limit = MAX_LIMIT
 
-    query = select(Movie).where(Movie.vote_average.is_not(None))
-    
+    filters = [Movie.vote_average.is_not(None)]
     if min_rating is not None:
-        query = query.where(Movie.vote_average >= min_rating)
+        filters.append(Movie.vote_average >= min_rating)
     if max_rating is not None:
-        query = query.where(Movie.vote_average <= max_rating)
-    
+        filters.append(Movie.vote_average <= max_rating)
+
+    total = _count(db, filters) if include_total else None
+
     # Sort by rating descending (highest first)
-    query = query.order_by(Movie.vote_average.desc())
-    
-    total = db.scalar(select(func.count()).select_from(query.subquery())) or 0
-    
-    result = db.execute(query.offset(skip).limit(limit))
-    movies = list(result.scalars().all())
-    return movies, total
+    query = select(Movie).where(*filters).order_by(Movie.vote_average.desc())
+    movies, has_more = _fetch_page(db, query.offset(skip), limit)
+    return movies, total, has_more
 
 
-def _split_tokens(value: Optional[str]) -> set[str]:
+# Token names looked up per IN query when syncing a subset of movies
+_NAME_LOOKUP_CHUNK = 5000
+
+
+@lru_cache(maxsize=4096)
+def _split_tokens(value: Optional[str]) -> frozenset[str]:
+    """
+    Parse a comma-separated genres/keywords string into a set of tokens.
+
+    Memoised by the string value: the same genre combinations recur across
+    thousands of movies, so analytics and bulk rebuilds mostly hit the cache.
+    """
     if not value:
-        return set()
-    return {t.strip() for t in value.split(",") if t.strip()}
+        return frozenset()
+    return frozenset(t.strip() for t in value.split(",") if t.strip())
+
+
+def _rebuild_token_links(
+    db: Session,
+    rows: List[Tuple[int, Optional[str]]],
+    model,
+    link_model,
+    fk_name: str,
+    *,
+    replace_all: bool = True,
+) -> None:
+    names_by_movie = {movie_id: _split_tokens(value) for movie_id, value in rows}
+    all_names = set().union(*names_by_movie.values())
+
+    if all_names:
+        db.execute(
+            sqlite_insert(model).on_conflict_do_nothing(),
+            [{"name": name} for name in all_names],
+        )
+    if replace_all:
+        ids = dict(db.execute(select(model.name, model.id)).all())
+    else:
+        # Only this batch's names; chunked to stay under SQLite's
+        # bound-parameter limit on keyword-heavy batches
+        names = list(all_names)
+        ids = {}
+        for start in range(0, len(names), _NAME_LOOKUP_CHUNK):
+            chunk = names[start : start + _NAME_LOOKUP_CHUNK]
+            ids.update(
+                db.execute(select(model.name, model.id).where(model.name.in_(chunk))).all()
+            )
+
+    if replace_all:
+        db.execute(delete(link_model))
+    else:
+        db.execute(delete(link_model).where(link_model.movie_id.in_(names_by_movie)))
+    links = [
+        (movie_id, ids[name])
+        for movie_id, names in names_by_movie.items()
+        for name in names
+    ]
+    if links:
+        # A rebuild writes one row per movie/token pair, over a million for
+        # the full dataset. Sending plain tuples to the driver's executemany
+        # skips the per-row ORM bookkeeping and bind processing, which cost
+        # more than the inserts themselves.
+        db.connection().exec_driver_sql(
+            f"INSERT INTO {link_model.__tablename__} (movie_id, {fk_name}) VALUES (?, ?)",
+            links,
+        )
+
+
+def rebuild_movie_tokens(db: Session) -> None:
+    """
+    Rebuild the genre/keyword join tables from the comma-separated columns.
+
+    Used after bulk imports, which write movie rows directly and bypass
+    create_movie/update_movie. The caller is responsible for committing.
+    """
+    rows = db.execute(select(Movie.id, Movie.genres, Movie.keywords)).all()
+    _rebuild_token_links(
+        db, [(r.id, r.genres) for r in rows], Genre, MovieGenre, "genre_id"
+    )
+    _rebuild_token_links(
+        db, [(r.id, r.keywords) for r in rows], Keyword, MovieKeyword, "keyword_id"
+    )
+
+
+def sync_movie_tokens(
+    db: Session, rows: List[Tuple[int, Optional[str], Optional[str]]]
+) -> None:
+    """
+    Replace the genre/keyword join rows of the given movies only.
+
+    rows holds (movie_id, genres, keywords). Used by incremental imports,
+    where re-linking every movie would cost far more than the few rows
+    that changed. The caller is responsible for committing.
+    """
+    _rebuild_token_links(
+        db, [(r[0], r[1]) for r in rows], Genre, MovieGenre, "genre_id", replace_all=False
+    )
+    _rebuild_token_links(
+        db, [(r[0], r[2]) for r in rows], Keyword, MovieKeyword, "keyword_id", replace_all=False
+    )
+
+
+def rebuild_movie_search_index(db: Session) -> None:
+    """
+    Re-index every movie title in the trigram search table.
+
+    Needed after bulk "INSERT OR REPLACE" imports: SQLite doesn't fire the
+    delete trigger for replaced rows, leaving stale index entries behind.
+    The caller is responsible for committing.
+    """
+    db.execute(text(MOVIES_FTS_REBUILD))
 
 
 def get_similar_movies(
@@ -168,47 +447,82 @@ def get_similar_movies(
 ) -> List[SimilarMovie]:
     """
     Find movies similar to the reference movie based on overlapping genres and keywords.
+
+    Candidates are found through the genre/keyword join tables: every shared
+    genre contributes 2 and every shared keyword 1, summed per movie in SQL.
+    Filtering, ordering and the limit are applied in the database.
     """
-    ref_genres = _split_tokens(ref_movie.genres)
-    ref_keywords = _split_tokens(ref_movie.keywords)
+    ref_genre_ids = select(MovieGenre.genre_id).where(
+        MovieGenre.movie_id == ref_movie.id
+    )
+    ref_keyword_ids = select(MovieKeyword.keyword_id).where(
+        MovieKeyword.movie_id == ref_movie.id
+    )
+
+    # Weight genres higher than keywords
+    shared = union_all(
+        select(MovieGenre.movie_id, literal(2).label("weight")).where(
+            MovieGenre.genre_id.in_(ref_genre_ids)
+        ),
+        select(MovieKeyword.movie_id, literal(1).label("weight")).where(
+            MovieKeyword.keyword_id.in_(ref_keyword_ids)
+        ),
+    ).subquery()
+    score = func.sum(shared.c.weight)
+    scores = (
+        select(shared.c.movie_id, score.label("score"))
+        .group_by(shared.c.movie_id)
+        .having(score >= min_shared_tokens)
+        .subquery()
+    )
 
+    # Only id/title are returned, so don't load the wide movie rows
     query = (
-        select(Movie)
+        select(Movie.id, Movie.title, scores.c.score)
+        .join(scores, scores.c.movie_id == Movie.id)
         .where(Movie.id != ref_movie.id)
         .where(Movie.status == "released")
-    )
-    candidates = db.execute(query).scalars().all()
-
-    items: List[SimilarMovie] = []
-    for m in candidates:
-        g = _split_tokens(m.genres)
-        k = _split_tokens(m.keywords)
-        shared_g = sorted(ref_genres & g)
-        shared_k = sorted(ref_keywords & k)
-        score = len(shared_g) * 2 + len(shared_k)  # weight genres higher
-
-        if score >= min_shared_tokens:
-            items.append(
-                SimilarMovie(
-                    id=m.id,
-                    title=m.title,
-                    shared_genres=shared_g,
-                    shared_keywords=shared_k,
-                    similarity_score=score,
-                )
-            )
-
-    # Sort by rating (highest first), then similarity score, then title
-    # Need to get vote_average from the Movie objects
-    movie_dict = {m.id: m for m in candidates}
-    items.sort(
-        key=lambda x: (
-            -(movie_dict[x.id].vote_average or 0),  # Rating descending (highest first)
-            -x.similarity_score,  # Then similarity score
-            x.title.lower()  # Then alphabetically
+        # Sort by rating (highest first), then similarity score, then title
+        .order_by(
+            Movie.vote_average.desc(), scores.c.score.desc(), func.lower(Movie.title)
         )
+        .limit(limit)
     )
-    return items[:limit]
+    rows = db.execute(query).all()
+    if not rows:
+        return []
+
+    # Fetch the shared genre and keyword names for the returned movies only,
+    # in one round trip ("is_genre" tells the two halves apart)
+    movie_ids = [row.id for row in rows]
+    names = union_all(
+        select(MovieGenre.movie_id, Genre.name, literal(True).label("is_genre"))
+        .join(Genre, Genre.id == MovieGenre.genre_id)
+        .where(MovieGenre.movie_id.in_(movie_ids))
+        .where(MovieGenre.genre_id.in_(ref_genre_ids)),
+        select(MovieKeyword.movie_id, Keyword.name, literal(False).label("is_genre"))
+        .join(Keyword, Keyword.id == MovieKeyword.keyword_id)
+        .where(MovieKeyword.movie_id.in_(movie_ids))
+        .where(MovieKeyword.keyword_id.in_(ref_keyword_ids)),
+    ).subquery()
+    shared_genres: Dict[int, List[str]] = {}
+    shared_keywords: Dict[int, List[str]] = {}
+    for movie_id, name, is_genre in db.execute(
+        select(names.c.movie_id, names.c.name, names.c.is_genre).order_by(names.c.name)
+    ):
+        target = shared_genres if is_genre else shared_keywords
+        target.setdefault(movie_id, []).append(name)
+
+    return [
+        SimilarMovie(
+            id=row.id,
+            title=row.title,
+            shared_genres=shared_genres.get(row.id, []),
+            shared_keywords=shared_keywords.get(row.id, []),
+            similarity_score=row.score,
+        )
+        for row in rows
+    ]
 
 
 def get_genre_analytics(
@@ -230,10 +544,7 @@ def get_genre_analytics(
     stats: Dict[str, Dict[str, object]] = {}
 
     for m in movies:
-        if not m.genres:
-            continue
-        tokens = [t.strip() for t in m.genres.split(",") if t.strip()]
-        for g in tokens:
+        for g in _split_tokens(m.genres):
             entry = stats.setdefault(
                 g,
                 {
@@ -1,16 +1,16 @@
 from __future__ import annotations
 
-from typing import Iterable, List, Optional, Sequence
+from typing import Iterable, List, Optional
 
-from sqlalchemy import asc
+from sqlalchemy import Row, asc, delete, insert, select
 from sqlalchemy.orm import Session, selectinload
 
 from ..models.movie import Movie
 from ..models.movie_list import MovieList, MovieListItem
 
 
-def _resolve_titles_to_movies(db: Session, titles: Iterable[str]) -> List[Movie]:
-    """Resolve a list of (case-insensitive) titles to Movie objects.
+def _resolve_titles_to_movies(db: Session, titles: Iterable[str]) -> List[Row]:
+    """Resolve a list of (case-insensitive) titles to (id, title) movie rows.
 
     Duplicates are removed while preserving the original order of first appearance.
     """
@@ -30,40 +30,74 @@ def _resolve_titles_to_movies(db: Session, titles: Iterable[str]) -> List[Movie]
     if not normalised_titles:
         return []
 
-    movies: Sequence[Movie] = (
-        db.query(Movie)
-        .filter(Movie.title.in_(normalised_titles))
-        .order_by(asc(Movie.title))
-        .all()
-    )
+    # One IN query for all titles, compared with NOCASE so the match is
+    # case-insensitive even where the column predates its NOCASE collation
+    # (it is then also served by the title index). Only id/title are needed
+    # to build list items.
+    rows = db.execute(
+        select(Movie.id, Movie.title).where(
+            Movie.title.collate("NOCASE").in_(normalised_titles)
+        )
+    ).all()
 
     # Preserve input order: map by title (case-insensitive)
-    movies_by_title = {m.title.upper(): m for m in movies}
-    ordered: List[Movie] = []
+    movies_by_title = {row.title.upper(): row for row in rows}
+    ordered: List[Row] = []
     for t in normalised_titles:
-        m = movies_by_title.get(t.upper())
-        if m:
-            ordered.append(m)
+        row = movies_by_title.get(t.upper())
+        if row:
+            ordered.append(row)
     return ordered
 
 
+# Load a list's items and their movies in two extra IN (...) queries
+_ITEMS_WITH_MOVIES = selectinload(MovieList.items).selectinload(MovieListItem.movie)
+
+
+def _reload_list(db: Session, list_id: int) -> MovieList:
+    """Re-read a list after commit with its items and movies eagerly loaded."""
+    stmt = (
+        select(MovieList)
+        .options(_ITEMS_WITH_MOVIES)
+        .where(MovieList.id == list_id)
+    )
+    return db.execute(stmt).scalar_one()
+
+
 def get_list_by_name(db: Session, name: str) -> Optional[MovieList]:
     """READ: fetch a single list by its unique name."""
     return (
         db.query(MovieList)
-        .options(selectinload(MovieList.items).selectinload(MovieListItem.movie))
+        .options(_ITEMS_WITH_MOVIES)
         .filter(MovieList.name == name)
         .first()
     )
 
 
-def get_lists(db: Session) -> List[MovieList]:
-    """READ: fetch all lists."""
-    return (
-        db.query(MovieList)
-        .options(selectinload(MovieList.items).selectinload(MovieListItem.movie))
-        .order_by(asc(MovieList.name))
-        .all()
+def get_lists(db: Session) -> List[Row]:
+    """READ: fetch all lists as (id, name, description, size) rows.
+
+    Sizes come from the stored item_count, so no items or movies are read.
+    """
+    stmt = select(
+        MovieList.id,
+        MovieList.name,
+        MovieList.description,
+        MovieList.item_count.label("size"),
+    ).order_by(asc(MovieList.name))
+    return list(db.execute(stmt).all())
+
+
+def _insert_items(db: Session, list_id: int, movies: List[Row]) -> None:
+    """Insert list items in one multi-row INSERT, bypassing ORM unit-of-work."""
+    if not movies:
+        return
+    db.execute(
+        insert(MovieListItem),
+        [
+            {"list_id": list_id, "movie_id": movie.id, "position": position}
+            for position, movie in enumerate(movies, start=1)
+        ],
     )
 
 
@@ -71,25 +105,15 @@ def create_list(db: Session, name: str, description: Optional[str], movie_titles
     """CREATE: create a new curated movie list."""
     movies = _resolve_titles_to_movies(db, movie_titles)
 
-    movie_list = MovieList(name=name, description=description)
+    movie_list = MovieList(name=name, description=description, item_count=len(movies))
     db.add(movie_list)
     db.flush()  # assign id
+    list_id = movie_list.id
 
-    items: List[MovieListItem] = []
-    for position, movie in enumerate(movies, start=1):
-        items.append(
-            MovieListItem(
-                list_id=movie_list.id,
-                movie_id=movie.id,
-                position=position,
-            )
-        )
-    if items:
-        db.add_all(items)
+    _insert_items(db, list_id, movies)
 
     db.commit()
-    db.refresh(movie_list)
-    return movie_list
+    return _reload_list(db, list_id)
 
 
 def update_list(
@@ -102,25 +126,16 @@ def update_list(
     if description is not None:
         movie_list.description = description
 
+    list_id = movie_list.id
     if movie_titles is not None:
         # Clear existing items and rebuild positions from the new titles
-        db.query(MovieListItem).filter(MovieListItem.list_id == movie_list.id).delete()
+        db.execute(delete(MovieListItem).where(MovieListItem.list_id == list_id))
         movies = _resolve_titles_to_movies(db, movie_titles)
-        items: List[MovieListItem] = []
-        for position, movie in enumerate(movies, start=1):
-            items.append(
-                MovieListItem(
-                    list_id=movie_list.id,
-                    movie_id=movie.id,
-                    position=position,
-                )
-            )
-        if items:
-            db.add_all(items)
+        _insert_items(db, list_id, movies)
+        movie_list.item_count = len(movies)
 
     db.commit()
-    db.refresh(movie_list)
-    return movie_list
+    return _reload_list(db, list_id)
 
 
 def delete_list(db: Session, movie_list: MovieList) -> None:
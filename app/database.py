@@ -1,9 +1,15 @@
-from typing import Generator
+from typing import Optional
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy import Engine, create_engine, event, inspect, text
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
-from .core.config import DATABASE_URL
+from .core.config import (
+    DATABASE_URL,
+    DB_MAX_OVERFLOW,
+    DB_POOL_RECYCLE_SECONDS,
+    DB_POOL_SIZE,
+)
 
 
 class Base(DeclarativeBase):
@@ -13,8 +19,32 @@ class Base(DeclarativeBase):
 engine = create_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False},
+    poolclass=QueuePool,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_recycle=DB_POOL_RECYCLE_SECONDS,
+)
+
+# Per-connection SQLite tuning: WAL lets readers proceed while a write is in
+# progress, and the larger page cache keeps the working set in memory.
+SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "cache_size=-20000",
+    "busy_timeout=5000",
+    "foreign_keys=ON",
 )
 
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(f"PRAGMA {pragma}")
+    cursor.close()
+
+
 SessionLocal = sessionmaker(
     bind=engine,
     autoflush=False,
@@ -22,15 +52,57 @@ SessionLocal = sessionmaker(
 )
 
 
-def get_session() -> Generator:
+def init_db(bind: Optional[Engine] = None) -> None:
     """
-    Yield a new SQLAlchemy session.
-    Intended for internal usage; FastAPI dependency is defined in app.api.deps.
+    Create any missing tables and indexes for all registered models.
+
+    Called once on application startup rather than at import time.
+    create_all only creates indexes together with new tables, so indexes
+    added to existing tables are created individually afterwards. The same
+    applies to the title search index, which is built and filled if missing,
+    to the movie_lists.item_count column, which is added and backfilled, and
+    to the genre/keyword join tables, which are filled from the movies'
+    comma-separated columns if they are empty.
     """
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+    from .crud.movie import rebuild_movie_tokens
+    from .models import movie, movie_list  # noqa: F401 - register models
+
+    bind = bind or engine
+    Base.metadata.create_all(bind=bind)
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=bind, checkfirst=True)
+
+    with bind.begin() as conn:
+        # Superseded by ix_movies_status_rating, which leads with status
+        conn.execute(text("DROP INDEX IF EXISTS ix_movies_status"))
+
+        if not inspect(conn).has_table("movies_fts"):
+            for statement in movie.MOVIES_FTS_DDL:
+                conn.execute(text(statement))
+            conn.execute(text(movie.MOVIES_FTS_REBUILD))
 
+        list_columns = {c["name"] for c in inspect(conn).get_columns("movie_lists")}
+        if "item_count" not in list_columns:
+            conn.execute(
+                text("ALTER TABLE movie_lists ADD COLUMN item_count INTEGER NOT NULL DEFAULT 0")
+            )
+            conn.execute(
+                text(
+                    "UPDATE movie_lists SET item_count = "
+                    "(SELECT COUNT(*) FROM movie_list_items "
+                    "WHERE movie_list_items.list_id = movie_lists.id)"
+                )
+            )
 
+    with Session(bind=bind) as db:
+        has_links = db.execute(text("SELECT 1 FROM movie_genres LIMIT 1")).first()
+        needs_links = db.execute(
+            text(
+                "SELECT 1 FROM movies WHERE coalesce(genres, '') != '' "
+                "OR coalesce(keywords, '') != '' LIMIT 1"
+            )
+        ).first()
+        if needs_links and not has_links:
+            rebuild_movie_tokens(db)
+            db.commit()
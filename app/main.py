@@ -1,20 +1,30 @@
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.openapi.utils import get_openapi
 
-from .core.config import APP_NAME
-from .database import Base, engine, SessionLocal
-from .models import movie  # noqa: F401 - ensure models are imported for metadata
-from .models import movie_list  # noqa: F401 - ensure lists models are imported
+from .core.config import APP_NAME, HEALTH_COUNT_TTL_SECONDS, INIT_DB_ON_STARTUP
+from .database import SessionLocal, init_db
 from .routes import movies as movies_router
 from .routes import lists as lists_router
 from .routes import analytics as analytics_router
 from sqlalchemy import text
 
 
-# Create database tables based on SQLAlchemy models
-Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    # Create database tables once per process start, not on every import.
+    # Skipped when the schema is managed separately (MOVIES_INIT_DB=0).
+    if INIT_DB_ON_STARTUP:
+        init_db()
+    yield
+
 
 app = FastAPI(
+    lifespan=lifespan,
     title=APP_NAME,
     version="1.0.0",
     description="""
@@ -84,16 +94,41 @@ app = FastAPI(
 )
 
 
+# (expires_at, count) for the movie count reported by the health check.
+# Probes hit "/" frequently, so avoid a full COUNT(*) on every request.
+_movie_count_cache: tuple[float, int] = (0.0, 0)
+
+
+def _cached_movie_count() -> int | None:
+    expires_at, count = _movie_count_cache
+    return count if time.monotonic() < expires_at else None
+
+
+def _refresh_movie_count() -> int:
+    global _movie_count_cache
+    now = time.monotonic()
+    db = SessionLocal()
+    try:
+        count = db.execute(text("SELECT COUNT(*) FROM movies")).scalar() or 0
+    finally:
+        db.close()
+    _movie_count_cache = (now + HEALTH_COUNT_TTL_SECONDS, count)
+    return count
+
+
 @app.get("/", tags=["health"])
-def read_root() -> dict[str, str | int]:
+async def read_root() -> dict[str, str | int]:
     """
     Health check endpoint with database status.
     Returns API status and number of movies in the database.
+    The movie count is cached for a few seconds so frequent probes stay cheap:
+    cache hits are answered on the event loop without taking a worker thread,
+    and only a refresh runs the (blocking) query in the threadpool.
     """
-    db = SessionLocal()
     try:
-        result = db.execute(text("SELECT COUNT(*) FROM movies"))
-        movie_count = result.scalar() or 0
+        movie_count = _cached_movie_count()
+        if movie_count is None:
+            movie_count = await run_in_threadpool(_refresh_movie_count)
         return {
             "message": "Movies API is running",
             "database_status": "connected",
@@ -105,8 +140,6 @@ def read_root() -> dict[str, str | int]:
             "database_status": "error",
             "movies_count": 0,
         }
-    finally:
-        db.close()
 
 
 app.include_router(movies_router.router)
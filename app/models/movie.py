@@ -1,9 +1,22 @@
 from __future__ import annotations
 
-from typing import Optional
-
-from sqlalchemy import Boolean, Date, Float, Integer, String, Text
-from sqlalchemy.orm import Mapped, mapped_column
+from typing import List, Optional
+
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    Date,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    column,
+    event,
+    table,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..database import Base
 
@@ -14,22 +27,31 @@ class Movie(Base):
 
     Collection-like fields (genres, production_companies, spoken_languages, keywords)
     are stored as comma-separated strings, e.g. "Action,Drama".
+
+    Genres and keywords are additionally normalised into the genres/keywords
+    tables (via movie_genres/movie_keywords) so they can be filtered with an
+    index lookup instead of a substring scan.
     """
 
     __tablename__ = "movies"
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
 
-    title: Mapped[str] = mapped_column(String(255), index=True)
+    # NOCASE makes equality/IN comparisons (and the title index) case-insensitive
+    title: Mapped[str] = mapped_column(String(255, collation="NOCASE"), index=True)
     vote_average: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     vote_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
-    status: Mapped[Optional[str]] = mapped_column(String(50), nullable=True, index=True)
+    # Indexed through ix_movies_status_rating, which leads with status
+    status: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     release_date: Mapped[Optional[Date]] = mapped_column(Date, nullable=True)
     revenue: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     runtime: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
-    adult: Mapped[Optional[bool]] = mapped_column(Boolean, nullable=True, default=False)
+    # Index entries carry the rowid (id), so "WHERE adult = ? ORDER BY id" needs no sort
+    adult: Mapped[Optional[bool]] = mapped_column(
+        Boolean, nullable=True, default=False, index=True
+    )
 
     backdrop_path: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     budget: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
@@ -48,4 +70,112 @@ class Movie(Base):
     spoken_languages: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     keywords: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
+    genres_rel: Mapped[List["Genre"]] = relationship(
+        "Genre", secondary="movie_genres", order_by="Genre.name"
+    )
+    keywords_rel: Mapped[List["Keyword"]] = relationship(
+        "Keyword", secondary="movie_keywords", order_by="Keyword.name"
+    )
+
+
+# Serves "WHERE status = ? ORDER BY vote_average DESC" without a sort step
+Index("ix_movies_status_rating", Movie.status, Movie.vote_average.desc())
+# Serves rating range filters and the by-rating "ORDER BY vote_average DESC"
+Index("ix_movies_rating", Movie.vote_average.desc())
+
+
+# Trigram full-text index over movie titles. SQLite can answer
+# "title LIKE '%text%'" from it instead of scanning every movie row.
+# It is an external-content table (titles live in movies only), kept in sync
+# by triggers. create_all can't build virtual tables, so the DDL is attached
+# to the movies table below and replayed by init_db() for older databases.
+movies_fts = table("movies_fts", column("rowid", Integer), column("title", String))
+
+MOVIES_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS movies_fts USING fts5("
+    "title, content='movies', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS movies_fts_ai AFTER INSERT ON movies BEGIN "
+    "INSERT INTO movies_fts(rowid, title) VALUES (new.id, new.title); END",
+    "CREATE TRIGGER IF NOT EXISTS movies_fts_ad AFTER DELETE ON movies BEGIN "
+    "INSERT INTO movies_fts(movies_fts, rowid, title) VALUES ('delete', old.id, old.title); END",
+    "CREATE TRIGGER IF NOT EXISTS movies_fts_au AFTER UPDATE OF title ON movies BEGIN "
+    "INSERT INTO movies_fts(movies_fts, rowid, title) VALUES ('delete', old.id, old.title); "
+    "INSERT INTO movies_fts(rowid, title) VALUES (new.id, new.title); END",
+)
+
+# Re-index every title, e.g. after bulk "INSERT OR REPLACE" imports, which
+# don't fire the delete trigger for the rows they replace.
+MOVIES_FTS_REBUILD = "INSERT INTO movies_fts(movies_fts) VALUES ('rebuild')"
+
+for _statement in MOVIES_FTS_DDL:
+    event.listen(Movie.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+event.listen(
+    Movie.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS movies_fts").execute_if(dialect="sqlite"),
+)
+
+
+class MovieCsvHash(Base):
+    """
+    Hash of the values last written for a movie by the CSV import.
+
+    Lets a repeat import skip rows that would be rewritten unchanged.
+    """
+
+    __tablename__ = "movies_csv_hash"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    row_hash: Mapped[int] = mapped_column(Integer)
+
+
+class Genre(Base):
+    """A distinct genre name, e.g. "Action"."""
+
+    __tablename__ = "genres"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(100), unique=True, index=True)
+
+
+class Keyword(Base):
+    """A distinct keyword, e.g. "time travel"."""
+
+    __tablename__ = "keywords"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(255), unique=True, index=True)
+
+
+class MovieGenre(Base):
+    """Association table linking Movie to Genre."""
+
+    __tablename__ = "movie_genres"
+    __table_args__ = (
+        # Inverted index genre -> movies. Covering, so similarity scoring reads
+        # movie ids straight from the index without touching the table.
+        Index("ix_movie_genres_genre_movie", "genre_id", "movie_id"),
+    )
+
+    movie_id: Mapped[int] = mapped_column(
+        ForeignKey("movies.id", ondelete="CASCADE"), primary_key=True
+    )
+    genre_id: Mapped[int] = mapped_column(
+        ForeignKey("genres.id", ondelete="CASCADE"), primary_key=True
+    )
+
+
+class MovieKeyword(Base):
+    """Association table linking Movie to Keyword."""
+
+    __tablename__ = "movie_keywords"
+    __table_args__ = (
+        Index("ix_movie_keywords_keyword_movie", "keyword_id", "movie_id"),
+    )
 
+    movie_id: Mapped[int] = mapped_column(
+        ForeignKey("movies.id", ondelete="CASCADE"), primary_key=True
+    )
+    keyword_id: Mapped[int] = mapped_column(
+        ForeignKey("keywords.id", ondelete="CASCADE"), primary_key=True
+    )
@@ -4,6 +4,7 @@ from datetime import datetime
 from typing import List, Optional
 
 from sqlalchemy import DateTime, ForeignKey, Integer, String
+from sqlalchemy.ext.associationproxy import AssociationProxy, association_proxy
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..database import Base
@@ -23,6 +24,11 @@ class MovieList(Base):
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(255), unique=True, index=True)
     description: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    # Number of items, kept in step by the CRUD layer so listing all lists
+    # doesn't need to count movie_list_items
+    item_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow, nullable=False
     )
@@ -41,6 +47,9 @@ class MovieList(Base):
         lazy="selectin",
     )
 
+    # The list's movies in position order, read straight through the items
+    movies: AssociationProxy[List[Movie]] = association_proxy("items", "movie")
+
 
 class MovieListItem(Base):
     """
@@ -61,5 +70,6 @@ class MovieListItem(Base):
     movie_list: Mapped[MovieList] = relationship(
         "MovieList", back_populates="items"
     )
-    movie: Mapped[Movie] = relationship(Movie, lazy="joined")
+    # Loaded explicitly with selectinload() in the CRUD layer
+    movie: Mapped[Movie] = relationship(Movie)
 
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Query, Response
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
-from ..api.deps import get_db
+from ..api.deps import DB
+from ..core.responses import json_response
 from ..crud import movie as crud_movie
 from ..schemas.movie import GenreFilter, GenreStats
 
@@ -14,6 +16,10 @@ router = APIRouter(
     tags=["analytics"],
 )
 
+# The CRUD layer already returns GenreStats models, so they are dumped to JSON
+# bytes in pydantic-core directly rather than re-validated by FastAPI.
+_GENRE_STATS_ADAPTER = TypeAdapter(List[GenreStats])
+
 
 @router.get(
     "/genres",
@@ -38,8 +44,8 @@ def get_genre_analytics_endpoint(
         description="**Top N** - Number of top movies to include for each genre (1-10).",
         example=3,
     ),
-    db: Session = Depends(get_db),
-) -> List[GenreStats]:
+    db: Session = DB,
+) -> Response:
     """
     Compute analytics per genre.
 
@@ -50,6 +56,6 @@ def get_genre_analytics_endpoint(
     """
     results = crud_movie.get_genre_analytics(db, top_n=top_n)
     if genre is not None:
-        return [g for g in results if g.genre == genre.value]
-    return results
+        results = [g for g in results if g.genre == genre.value]
+    return json_response(_GENRE_STATS_ADAPTER.dump_json(results))
 
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Path, status
+from fastapi import APIRouter, Depends, HTTPException, Path, Request, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
-from ..api.deps import get_db, verify_api_key
+from ..api.deps import DB, verify_api_key
+from ..core.cache import cached_json_response, response_cache
+from ..core.responses import json_response, not_found
 from .. import crud
 from ..schemas.movie_list import (
     MovieListCreate,
@@ -19,6 +22,8 @@ router = APIRouter(
     tags=["lists"],
 )
 
+_SUMMARIES_ADAPTER = TypeAdapter(List[MovieListSummary])
+
 
 @router.post(
     "",
@@ -34,8 +39,8 @@ router = APIRouter(
 )
 def create_movie_list(
     payload: MovieListCreate,
-    db: Session = Depends(get_db),
-) -> MovieListRead:
+    db: Session = DB,
+) -> Response:
     existing = crud.movie_list.get_list_by_name(db, payload.name)
     if existing:
         raise HTTPException(
@@ -49,12 +54,11 @@ def create_movie_list(
         description=payload.description,
         movie_titles=payload.movie_titles,
     )
+    response_cache.clear()
 
-    return MovieListRead(
-        id=movie_list.id,
-        name=movie_list.name,
-        description=movie_list.description,
-        movies=[item.movie for item in movie_list.items],
+    return json_response(
+        MovieListRead.model_validate(movie_list).model_dump_json(),
+        status.HTTP_201_CREATED,
     )
 
 
@@ -65,18 +69,28 @@ def create_movie_list(
     description="READ all curated movie lists with basic information and the number of movies in each list.",
 )
 def list_movie_lists(
-    db: Session = Depends(get_db),
-) -> List[MovieListSummary]:
+    request: Request,
+    db: Session = DB,
+) -> Response:
+    cache_key = response_cache.key_for(request)
+    generation = response_cache.generation
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return json_response(cached)
+
     lists = crud.movie_list.get_lists(db)
-    return [
+    summaries = [
         MovieListSummary(
-            id=ml.id,
-            name=ml.name,
-            description=ml.description,
-            size=len(ml.items),
+            id=row.id,
+            name=row.name,
+            description=row.description,
+            size=row.size,
         )
-        for ml in lists
+        for row in lists
     ]
+    return cached_json_response(
+        cache_key, _SUMMARIES_ADAPTER.dump_json(summaries), generation
+    )
 
 
 @router.get(
@@ -86,21 +100,24 @@ def list_movie_lists(
     description="READ a single curated movie list by its unique **name** (not by ID).",
 )
 def get_movie_list(
+    request: Request,
     name: str = Path(..., description="Unique name of the curated movie list.", example="Christopher Nolan Essentials"),
-    db: Session = Depends(get_db),
-) -> MovieListRead:
+    db: Session = DB,
+) -> Response:
+    cache_key = response_cache.key_for(request)
+    generation = response_cache.generation
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return json_response(cached)
+
     movie_list = crud.movie_list.get_list_by_name(db, name)
     if not movie_list:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"List with name '{name}' not found",
-        )
+        return not_found(f"List with name '{name}' not found")
 
-    return MovieListRead(
-        id=movie_list.id,
-        name=movie_list.name,
-        description=movie_list.description,
-        movies=[item.movie for item in movie_list.items],
+    return cached_json_response(
+        cache_key,
+        MovieListRead.model_validate(movie_list).model_dump_json(),
+        generation,
     )
 
 
@@ -117,14 +134,11 @@ def get_movie_list(
 def update_movie_list(
     name: str = Path(..., description="Unique name of the curated movie list to update."),
     payload: MovieListUpdate = ...,
-    db: Session = Depends(get_db),
-) -> MovieListRead:
+    db: Session = DB,
+) -> Response:
     movie_list = crud.movie_list.get_list_by_name(db, name)
     if not movie_list:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"List with name '{name}' not found",
-        )
+        return not_found(f"List with name '{name}' not found")
 
     updated = crud.movie_list.update_list(
         db,
@@ -132,32 +146,27 @@ def update_movie_list(
         description=payload.description,
         movie_titles=payload.movie_titles,
     )
+    response_cache.clear()
 
-    return MovieListRead(
-        id=updated.id,
-        name=updated.name,
-        description=updated.description,
-        movies=[item.movie for item in updated.items],
-    )
+    return json_response(MovieListRead.model_validate(updated).model_dump_json())
 
 
 @router.delete(
     "/{name}",
     status_code=status.HTTP_204_NO_CONTENT,
+    response_model=None,
     summary="DELETE: curated movie list",
     description="DELETE a curated movie list by its unique **name** (and all its items).",
     dependencies=[Depends(verify_api_key)],
 )
 def delete_movie_list(
     name: str = Path(..., description="Unique name of the curated movie list to delete."),
-    db: Session = Depends(get_db),
-) -> None:
+    db: Session = DB,
+) -> Optional[Response]:
     movie_list = crud.movie_list.get_list_by_name(db, name)
     if not movie_list:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"List with name '{name}' not found",
-        )
+        return not_found(f"List with name '{name}' not found")
 
     crud.movie_list.delete_list(db, movie_list)
+    response_cache.clear()
 
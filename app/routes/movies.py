@@ -1,24 +1,59 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
-from ..api.deps import get_db, verify_api_key
+from ..api.deps import DB, verify_api_key
+from ..core.cache import cached_json_response, response_cache
+from ..core.responses import json_response, not_found
 from ..core.config import DEFAULT_LIMIT
 from ..crud import movie as crud_movie
-from ..models.movie import Movie
 from ..schemas.movie import (
     GenreFilter,
     MovieCreate,
     MovieListResponse,
     MovieRead,
+    MovieSummary,
+    MovieSummaryListResponse,
     SimilarMoviesResponse,
 )
 
 router = APIRouter(prefix="/movies", tags=["movies"])
 
+# List endpoints serialise straight to JSON bytes with pydantic-core and
+# return a Response, which skips FastAPI's second validation pass of the
+# result. response_model on each route still documents the shape.
+_MOVIE_ADAPTER = TypeAdapter(MovieRead)
+_MOVIES_ADAPTER = TypeAdapter(List[MovieRead])
+_SUMMARIES_ADAPTER = TypeAdapter(List[MovieSummary])
+
+# Rows serialised per chunk written by GET /movies/stream
+_STREAM_BATCH_SIZE = 200
+
+
+@lru_cache(maxsize=32)
+def _normalise_status(value: str) -> str:
+    return value.strip().lower()
+
+
+def _stream_summaries(rows: Iterable[object]) -> Iterator[bytes]:
+    """Emit {"items": [...]} as JSON, one chunk per batch of rows."""
+    rows = iter(rows)
+    yield b'{"items":['
+    separator = b""
+    while batch := list(islice(rows, _STREAM_BATCH_SIZE)):
+        items = _SUMMARIES_ADAPTER.validate_python(batch, from_attributes=True)
+        # Strip the surrounding [ ] so batches join into one array
+        yield separator + _SUMMARIES_ADAPTER.dump_json(items)[1:-1]
+        separator = b","
+    yield b"]}"
+
 
 @router.post(
     "",
@@ -31,8 +66,8 @@ router = APIRouter(prefix="/movies", tags=["movies"])
 )
 def create_movie_endpoint(
     movie_in: MovieCreate,
-    db: Session = Depends(get_db),
-) -> MovieRead:
+    db: Session = DB,
+) -> Response:
     """
     Create a new movie record.
     
@@ -47,17 +82,24 @@ def create_movie_endpoint(
     ```
     """
     movie = crud_movie.create_movie(db, movie_in)
-    return movie
+    response_cache.clear()
+    item = _MOVIE_ADAPTER.validate_python(movie, from_attributes=True)
+    return json_response(_MOVIE_ADAPTER.dump_json(item), status.HTTP_201_CREATED)
 
 
 @router.get(
     "",
-    response_model=MovieListResponse,
+    response_model=MovieSummaryListResponse,
     summary="List movies with pagination and filters",
-    description="Get a paginated list of movies with optional filters. Use `skip` and `limit` for pagination.",
-    response_description="A paginated list of movies with total count.",
+    description=(
+        "Get a paginated list of movies with optional filters. Use `skip` and `limit` for pagination. "
+        "Each item is a compact summary (`id`, `title`, `vote_average`, `release_date`, `poster_path`); "
+        "use `/movies/by-title/{title}` for full movie details."
+    ),
+    response_description="A paginated list of movies; `total` is included when `include_total=true`.",
 )
 def list_movies_endpoint(
+    request: Request,
     skip: int = Query(
         0,
         ge=0,
@@ -85,8 +127,9 @@ def list_movies_endpoint(
         description="**Adult Filter** - Filter by adult content flag. `true` = adult movies only, `false` = non-adult only.",
         example=False,
     ),
-    status: Optional[str] = Query(
+    status_filter: Optional[str] = Query(
         None,
+        alias="status",
         description="**Status Filter** - Filter by release status. Options: `released` or `not released`.",
         example="released",
     ),
@@ -97,8 +140,18 @@ def list_movies_endpoint(
         description="**Minimum Rating** - Only return movies with rating >= this value (0-10 scale).",
         example=7.5,
     ),
-    db: Session = Depends(get_db),
-) -> MovieListResponse:
+    after_id: Optional[int] = Query(
+        None,
+        ge=0,
+        description="**Cursor** - Only return movies with an ID greater than this value. Pass the `next_cursor` from the previous page; `skip` is ignored when set.",
+    ),
+    include_total: bool = Query(
+        False,
+        description="**Include Total** - If `true`, also count all matching movies and return it as `total`. Off by default because counting scans every match.",
+        example=False,
+    ),
+    db: Session = DB,
+) -> Response:
     """
     Get a paginated list of movies with optional filters.
     
@@ -108,21 +161,101 @@ def list_movies_endpoint(
     - Filter by genre: `/movies?genre=Action&limit=10`
     - Search by title: `/movies?title=matrix`
     - Highly-rated movies: `/movies?min_vote_average=8.0&limit=10`
+    - Cursor pagination: `/movies?limit=20&after_id=<next_cursor>`
     """
-    # Convert enum to plain string for the CRUD layer
-    genre_value: Optional[str] = genre.value if isinstance(genre, GenreFilter) else genre
+    cache_key = response_cache.key_for(request)
+    generation = response_cache.generation
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return json_response(cached)
 
-    movies, total = crud_movie.get_movies(
+    # FastAPI has already coerced genre to GenreFilter; pass its plain string on
+    genre_value: Optional[str] = genre.value if genre is not None else None
+
+    movies, total, has_more = crud_movie.get_movies(
         db,
         skip=skip,
         limit=limit,
         title=title,
         genre=genre_value,
         adult=adult,
-        status=status.strip().lower() if status else None,
+        status=_normalise_status(status_filter) if status_filter else None,
+        min_vote_average=min_vote_average,
+        after_id=after_id,
+        include_total=include_total,
+    )
+    page = MovieSummaryListResponse(
+        items=movies,
+        total=total,
+        skip=skip,
+        limit=limit,
+        has_more=has_more,
+        next_cursor=movies[-1].id if has_more else None,
+    )
+    return cached_json_response(cache_key, page.model_dump_json(), generation)
+
+
+@router.get(
+    "/stream",
+    summary="Stream all matching movies",
+    description=(
+        "Stream every movie matching the filters as compact summaries, without pagination. "
+        "The response is written in chunks as rows are read, so large result sets are never "
+        "held in memory at once. Filters are the same as `GET /movies`."
+    ),
+    response_description='A JSON object `{"items": [...]}` of movie summaries ordered by ID.',
+)
+def stream_movies_endpoint(
+    title: Optional[str] = Query(
+        None,
+        description="**Title Filter** - Search for movies containing this text (case-insensitive).",
+    ),
+    genre: Optional[GenreFilter] = Query(
+        None,
+        description="**Genre Filter** - Filter by genre. Select from dropdown menu.",
+    ),
+    adult: Optional[bool] = Query(
+        None,
+        description="**Adult Filter** - Filter by adult content flag.",
+    ),
+    status_filter: Optional[str] = Query(
+        None,
+        alias="status",
+        description="**Status Filter** - Filter by release status. Options: `released` or `not released`.",
+    ),
+    min_vote_average: Optional[float] = Query(
+        None,
+        ge=0,
+        le=10,
+        description="**Minimum Rating** - Only return movies with rating >= this value (0-10 scale).",
+    ),
+    after_id: Optional[int] = Query(
+        None,
+        ge=0,
+        description="**Cursor** - Only return movies with an ID greater than this value.",
+    ),
+    db: Session = DB,
+) -> StreamingResponse:
+    """
+    Stream movies matching the filters.
+
+    **Examples:**
+    - All released movies: `/movies/stream?status=released`
+    - All Action movies rated 7+: `/movies/stream?genre=Action&min_vote_average=7`
+    """
+    rows = crud_movie.stream_movies(
+        db,
+        title=title,
+        genre=genre.value if genre is not None else None,
+        adult=adult,
+        status=_normalise_status(status_filter) if status_filter else None,
         min_vote_average=min_vote_average,
+        after_id=after_id,
+        batch_size=_STREAM_BATCH_SIZE,
     )
-    return MovieListResponse(items=movies, total=total, skip=skip, limit=limit)
+    # rows reads lazily from db while the body streams; FastAPI >= 0.118
+    # (pinned in requirements.txt) closes the session only after the response
+    return StreamingResponse(_stream_summaries(rows), media_type="application/json")
 
 
 @router.get(
@@ -139,8 +272,8 @@ def get_movies_by_title_endpoint(
         description="**Exact Match** - If `true`, matches exact title only. If `false` (default), matches titles containing the text.",
         example=False,
     ),
-    db: Session = Depends(get_db),
-) -> List[MovieRead]:
+    db: Session = DB,
+) -> Response:
     """
     Find movies by title.
     
@@ -152,11 +285,9 @@ def get_movies_by_title_endpoint(
     """
     movies = crud_movie.get_movies_by_title(db, title, exact=exact)
     if not movies:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No movies found with title '{title}'",
-        )
-    return movies
+        return not_found(f"No movies found with title '{title}'")
+    items = _MOVIES_ADAPTER.validate_python(movies, from_attributes=True)
+    return json_response(_MOVIES_ADAPTER.dump_json(items))
 
 
 @router.get(
@@ -167,6 +298,7 @@ def get_movies_by_title_endpoint(
     response_description="Paginated list of movies in the specified genre.",
 )
 def get_movies_by_genre_endpoint(
+    request: Request,
     genre: GenreFilter,
     skip: int = Query(
         0,
@@ -180,8 +312,13 @@ def get_movies_by_genre_endpoint(
         description="**Limit** - Maximum number of movies to return. Example: `limit=10` returns up to 10 movies.",
         example=20,
     ),
-    db: Session = Depends(get_db),
-) -> MovieListResponse:
+    include_total: bool = Query(
+        False,
+        description="**Include Total** - If `true`, also count all matching movies and return it as `total`. Off by default because counting scans every match.",
+        example=False,
+    ),
+    db: Session = DB,
+) -> Response:
     """
     Find movies filtered by genre.
     
@@ -190,12 +327,21 @@ def get_movies_by_genre_endpoint(
     - Get first 10 Action movies: `/movies/by-genre/Action?limit=10`
     - Get next page: `/movies/by-genre/Action?skip=20&limit=20`
     
-    Genre matching is case-insensitive and checks if the genre appears in the movie's genres list.
+    Genre matching uses the normalised genre table, so only movies tagged with exactly this genre are returned.
     """
-    movies, total = crud_movie.get_movies_by_genre(
-        db, genre.value, skip=skip, limit=limit
+    cache_key = response_cache.key_for(request)
+    generation = response_cache.generation
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return json_response(cached)
+
+    movies, total, has_more = crud_movie.get_movies_by_genre(
+        db, genre.value, skip=skip, limit=limit, include_total=include_total
+    )
+    page = MovieListResponse(
+        items=movies, total=total, skip=skip, limit=limit, has_more=has_more
     )
-    return MovieListResponse(items=movies, total=total, skip=skip, limit=limit)
+    return cached_json_response(cache_key, page.model_dump_json(), generation)
 
 
 @router.get(
@@ -206,6 +352,7 @@ def get_movies_by_genre_endpoint(
     response_description="Paginated list of movies sorted by rating (highest to lowest).",
 )
 def get_movies_by_rating_endpoint(
+    request: Request,
     min_rating: Optional[float] = Query(
         None,
         ge=0,
@@ -232,8 +379,13 @@ def get_movies_by_rating_endpoint(
         description="**Limit** - Maximum number of movies to return. Example: `limit=10` returns up to 10 movies.",
         example=20,
     ),
-    db: Session = Depends(get_db),
-) -> MovieListResponse:
+    include_total: bool = Query(
+        False,
+        description="**Include Total** - If `true`, also count all matching movies and return it as `total`. Off by default because counting scans every match.",
+        example=False,
+    ),
+    db: Session = DB,
+) -> Response:
     """
     Find movies filtered by rating range.
     
@@ -245,15 +397,29 @@ def get_movies_by_rating_endpoint(
     **Note:** At least one of `min_rating` or `max_rating` must be provided.
     Results are sorted by rating descending (highest rated first).
     """
+    cache_key = response_cache.key_for(request)
+    generation = response_cache.generation
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return json_response(cached)
+
     if min_rating is None and max_rating is None:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail="At least one of min_rating or max_rating must be provided",
         )
-    movies, total = crud_movie.get_movies_by_rating(
-        db, min_rating=min_rating, max_rating=max_rating, skip=skip, limit=limit
+    movies, total, has_more = crud_movie.get_movies_by_rating(
+        db,
+        min_rating=min_rating,
+        max_rating=max_rating,
+        skip=skip,
+        limit=limit,
+        include_total=include_total,
     )
-    return MovieListResponse(items=movies, total=total, skip=skip, limit=limit)
+    page = MovieListResponse(
+        items=movies, total=total, skip=skip, limit=limit, has_more=has_more
+    )
+    return cached_json_response(cache_key, page.model_dump_json(), generation)
 
 
 @router.get(
@@ -264,6 +430,7 @@ def get_movies_by_rating_endpoint(
     response_description="List of similar movies with shared genres/keywords and similarity scores.",
 )
 def get_similar_movies_by_title_endpoint(
+    request: Request,
     title: str,
     limit: int = Query(
         10,
@@ -278,8 +445,8 @@ def get_similar_movies_by_title_endpoint(
         description="**Minimum Shared Tokens** - Minimum similarity score required (based on shared genres/keywords). Higher = more similar.",
         example=1,
     ),
-    db: Session = Depends(get_db),
-) -> SimilarMoviesResponse:
+    db: Session = DB,
+) -> Response:
     """
     Find movies similar to a given movie.
     
@@ -295,22 +462,26 @@ def get_similar_movies_by_title_endpoint(
     
     Returns movies with shared genres/keywords, sorted by rating (highest to lowest).
     """
+    cache_key = response_cache.key_for(request)
+    generation = response_cache.generation
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return json_response(cached)
+
     ref = crud_movie.get_movie_by_title(db, title)
     if not ref:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Movie with title '{title}' not found",
-        )
+        return not_found(f"Movie with title '{title}' not found")
 
     items = crud_movie.get_similar_movies(
         db, ref_movie=ref, limit=limit, min_shared_tokens=min_shared_tokens
     )
 
-    return SimilarMoviesResponse(
+    result = SimilarMoviesResponse(
         movie_id=ref.id,
         reference_title=ref.title,
         items=items,
     )
+    return cached_json_response(cache_key, result.model_dump_json(), generation)
 
 
 
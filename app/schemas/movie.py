@@ -4,9 +4,7 @@ from datetime import date
 from enum import Enum
 from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict, validator
-
-from ..core.config import MOVIE_STATUS_VALUES
+from pydantic import BaseModel, ConfigDict, create_model, field_validator
 
 
 class GenreFilter(str, Enum):
@@ -36,11 +34,21 @@ class GenreFilter(str, Enum):
     WESTERN = "Western"
 
 
+class MovieStatus(str, Enum):
+    """Allowed movie release statuses, stored lowercase."""
+
+    RELEASED = "released"
+    NOT_RELEASED = "not released"
+
+
 class MovieBase(BaseModel):
+    # Statuses are stored and returned as plain strings
+    model_config = ConfigDict(use_enum_values=True)
+
     title: str
     vote_average: Optional[float] = None
     vote_count: Optional[int] = None
-    status: Optional[str] = None
+    status: Optional[MovieStatus] = None
     release_date: Optional[date] = None
     revenue: Optional[int] = None
     runtime: Optional[int] = None
@@ -60,16 +68,11 @@ class MovieBase(BaseModel):
     spoken_languages: Optional[str] = None
     keywords: Optional[str] = None
 
-    @validator("status")
-    def normalise_status(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return v
-        value = v.strip().lower()
-        if value not in MOVIE_STATUS_VALUES:
-            raise ValueError(
-                f"status must be one of {sorted(MOVIE_STATUS_VALUES)}, got '{v}'"
-            )
-        return value
+    @field_validator("status", mode="before")
+    @classmethod
+    def normalise_status(cls, v: object) -> object:
+        # Accept any casing/whitespace; the enum itself checks the value
+        return v.strip().lower() if isinstance(v, str) else v
 
 
 class MovieCreate(MovieBase):
@@ -78,49 +81,34 @@ class MovieCreate(MovieBase):
     title: str
 
 
-class MovieUpdate(BaseModel):
-    """
-    Schema for updating a movie.
-    For simplicity, all fields are optional; provided fields overwrite existing ones.
-    """
+# Schema for updating a movie: every MovieBase field, made optional with a None
+# default, so provided fields overwrite existing ones. Generated from MovieBase
+# so the field list and the status validator are defined once.
+MovieUpdate = create_model(
+    "MovieUpdate",
+    __base__=MovieBase,
+    __doc__="Schema for updating a movie. All fields are optional.",
+    **{
+        name: (Optional[field.annotation], None)
+        for name, field in MovieBase.model_fields.items()
+    },
+)
 
-    title: Optional[str] = None
-    vote_average: Optional[float] = None
-    vote_count: Optional[int] = None
-    status: Optional[str] = None
-    release_date: Optional[date] = None
-    revenue: Optional[int] = None
-    runtime: Optional[int] = None
-    adult: Optional[bool] = None
-    backdrop_path: Optional[str] = None
-    budget: Optional[int] = None
-    homepage: Optional[str] = None
-    imdb_id: Optional[str] = None
-    original_language: Optional[str] = None
-    original_title: Optional[str] = None
-    overview: Optional[str] = None
-    popularity: Optional[float] = None
-    poster_path: Optional[str] = None
-    tagline: Optional[str] = None
-    genres: Optional[str] = None
-    production_companies: Optional[str] = None
-    spoken_languages: Optional[str] = None
-    keywords: Optional[str] = None
 
-    @validator("status")
-    def normalise_status(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return v
-        value = v.strip().lower()
-        if value not in MOVIE_STATUS_VALUES:
-            raise ValueError(
-                f"status must be one of {sorted(MOVIE_STATUS_VALUES)}, got '{v}'"
-            )
-        return value
+class MovieRead(MovieBase):
+    id: int
 
+    model_config = ConfigDict(from_attributes=True)
+
+
+class MovieSummary(BaseModel):
+    """Compact movie representation used by the GET /movies listing."""
 
-class MovieRead(MovieBase):
     id: int
+    title: str
+    vote_average: Optional[float] = None
+    release_date: Optional[date] = None
+    poster_path: Optional[str] = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -138,9 +126,20 @@ class GenreStats(BaseModel):
 
 class MovieListResponse(BaseModel):
     items: List[MovieRead]
-    total: int
+    total: Optional[int] = None
+    skip: int
+    limit: int
+    has_more: bool = False
+    next_cursor: Optional[int] = None
+
+
+class MovieSummaryListResponse(BaseModel):
+    items: List[MovieSummary]
+    total: Optional[int] = None
     skip: int
     limit: int
+    has_more: bool = False
+    next_cursor: Optional[int] = None
 
 
 class SimilarMovie(BaseModel):
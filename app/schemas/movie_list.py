@@ -58,3 +58,5 @@ class MovieListRead(BaseModel):
     description: Optional[str] = None
     movies: List[MovieRead]
 
+    model_config = ConfigDict(from_attributes=True)
+
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from ..database import init_db
+
+
+def main() -> None:
+    init_db()
+    print("✓ Database tables created successfully")
+
+
+if __name__ == "__main__":
+    main()
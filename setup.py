@@ -68,9 +68,8 @@ def main():
     try:
         # Add project root to path
         sys.path.insert(0, str(Path.cwd()))
-        from app.database import Base, engine
-        from app.models import movie  # noqa: F401 - register model
-        Base.metadata.create_all(bind=engine)
+        from app.database import init_db
+        init_db()
         print("  Database tables created")
     except Exception as e:
         print(f"  Error creating tables: {e}")
@@ -42,12 +42,7 @@ echo "  Dependencies installed"
 # Create database tables
 echo ""
 echo "✓ Creating database tables..."
-python - << 'PY'
-from app.database import Base, engine
-from app.models import movie  # register Movie model
-Base.metadata.create_all(bind=engine)
-print("  Database tables created")
-PY
+python -m app.utils.init_db
 
 # Check if CSV file exists and import if found
 echo ""
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from typing import Generator
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.deps import get_db
+from app.core.cache import response_cache
+from app.database import Base
+from app.main import app
+
+# In-memory database; StaticPool hands every checkout the same connection,
+# so the app's sessions and the test transaction all see one database
+SQLALCHEMY_TEST_DATABASE_URL = "sqlite://"
+
+# Request sessions join the per-test transaction through a SAVEPOINT, so the
+# routes' commits never reach the database and each test is rolled back.
+TestingSessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    join_transaction_mode="create_savepoint",
+)
+
+
+def override_get_db() -> Generator[Session, None, None]:
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def _disable_pysqlite_transactions(dbapi_connection, _connection_record) -> None:
+    # pysqlite's implicit BEGIN handling breaks SAVEPOINT; let SQLAlchemy
+    # emit BEGIN itself instead
+    dbapi_connection.isolation_level = None
+
+
+@pytest.fixture(scope="session")
+def engine() -> Generator[Engine, None, None]:
+    engine = create_engine(
+        SQLALCHEMY_TEST_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    event.listen(engine, "connect", _disable_pysqlite_transactions)
+    event.listen(engine, "begin", lambda conn: conn.exec_driver_sql("BEGIN"))
+
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def client(engine: Engine) -> Generator[TestClient, None, None]:
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db, None)
+
+
+@pytest.fixture(autouse=True)
+def db_transaction(engine: Engine) -> Generator[None, None, None]:
+    """Run each test inside a transaction that is rolled back afterwards."""
+    connection = engine.connect()
+    transaction = connection.begin()
+    TestingSessionLocal.configure(bind=connection)
+    # Cached responses may describe rows from an earlier, rolled back test
+    response_cache.clear()
+    try:
+        yield
+    finally:
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture
+def db_session(db_transaction: None) -> Generator[Session, None, None]:
+    """A session on the test transaction, for seeding rows without HTTP."""
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
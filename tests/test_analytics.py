@@ -1,41 +1,11 @@
 from __future__ import annotations
 
-from typing import Generator
-
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
-
-from app.api.deps import get_db
-from app.database import Base
-from app.main import app
-
-SQLALCHEMY_TEST_DATABASE_URL = "sqlite:///./test_movies.db"
-
-engine = create_engine(
-    SQLALCHEMY_TEST_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-)
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-
-def override_get_db() -> Generator[Session, None, None]:
-    db = TestingSessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
-app.dependency_overrides[get_db] = override_get_db
-
-Base.metadata.drop_all(bind=engine)
-Base.metadata.create_all(bind=engine)
 
-client = TestClient(app)
+API_KEY_HEADERS = {"X-API-Key": "dev-secret-key"}
 
 
-def test_genre_analytics() -> None:
+def test_genre_analytics(client: TestClient) -> None:
     # Seed a few movies with genres and ratings
     client.post(
         "/movies",
@@ -47,6 +17,7 @@ def test_genre_analytics() -> None:
             "runtime": 100,
             "popularity": 50.0,
         },
+        headers=API_KEY_HEADERS,
     )
     client.post(
         "/movies",
@@ -58,6 +29,7 @@ def test_genre_analytics() -> None:
             "runtime": 110,
             "popularity": 60.0,
         },
+        headers=API_KEY_HEADERS,
     )
     client.post(
         "/movies",
@@ -69,6 +41,7 @@ def test_genre_analytics() -> None:
             "runtime": 120,
             "popularity": 40.0,
         },
+        headers=API_KEY_HEADERS,
     )
 
     resp = client.get("/analytics/genres", params={"top_n": 2})
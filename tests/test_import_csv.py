@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import csv
+import shutil
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from app.models.movie import Movie
+from app.utils.import_csv import import_csv
+
+HEADER = ["id", "title", "status", "release_date", "adult", "genres", "keywords", "overview"]
+
+ROWS = [
+    ["1", "Alpha Heist", "Released", "2020-01-05", "False", "Action, Crime", "heist", "First"],
+    ["2", "Beta Romance", "Released", "5/1/2021", "False", "Drama, Romance", "love", "Two\nlines"],
+    ["3", "Gamma Quest", "Unreleased", "", "True", "Adventure", "", ""],
+]
+
+
+def _write_csv(path: Path, rows: list[list[str]]) -> Path:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADER)
+        writer.writerows(rows)
+    return path
+
+
+def _snapshot(db_path: Path) -> dict:
+    conn = sqlite3.connect(db_path)
+    try:
+        # Raises if the external-content index disagrees with the movies table
+        conn.execute("INSERT INTO movies_fts(movies_fts) VALUES ('integrity-check')")
+        return {
+            "movies": conn.execute(
+                "SELECT id, title, status, release_date, adult, genres, keywords, overview "
+                "FROM movies ORDER BY id"
+            ).fetchall(),
+            "genres": conn.execute(
+                "SELECT mg.movie_id, g.name FROM movie_genres mg "
+                "JOIN genres g ON g.id = mg.genre_id ORDER BY 1, 2"
+            ).fetchall(),
+            "keywords": conn.execute(
+                "SELECT mk.movie_id, k.name FROM movie_keywords mk "
+                "JOIN keywords k ON k.id = mk.keyword_id ORDER BY 1, 2"
+            ).fetchall(),
+            "title_search": conn.execute(
+                "SELECT rowid FROM movies_fts WHERE title LIKE '%a%' ORDER BY rowid"
+            ).fetchall(),
+            "indexes": {
+                name
+                for (name,) in conn.execute(
+                    "SELECT name FROM sqlite_master "
+                    "WHERE type = 'index' AND tbl_name = 'movies' AND sql IS NOT NULL"
+                )
+            },
+        }
+    finally:
+        conn.close()
+
+
+def _import(csv_path: Path, db_path: Path, *, force: bool = False) -> None:
+    import_csv(str(csv_path), f"sqlite:///{db_path}", force=force)
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    return tmp_path / "movies.db"
+
+
+def test_fresh_import(tmp_path: Path, db_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    _import(_write_csv(tmp_path / "movies.csv", ROWS), db_path)
+    assert "Imported 3 movies" in capsys.readouterr().out
+
+    snapshot = _snapshot(db_path)
+    assert snapshot["movies"] == [
+        (1, "Alpha Heist", "released", "2020-01-05", 0, "Action, Crime", "heist", "First"),
+        (2, "Beta Romance", "released", "2021-01-05", 0, "Drama, Romance", "love", "Two\nlines"),
+        (3, "Gamma Quest", "not released", None, 1, "Adventure", None, None),
+    ]
+    assert snapshot["genres"] == [
+        (1, "Action"),
+        (1, "Crime"),
+        (2, "Drama"),
+        (2, "Romance"),
+        (3, "Adventure"),
+    ]
+    assert snapshot["keywords"] == [(1, "heist"), (2, "love")]
+    assert snapshot["title_search"] == [(1,), (2,), (3,)]
+    # Indexes dropped for the bulk load are all restored
+    assert snapshot["indexes"] == {index.name for index in Movie.__table__.indexes}
+
+
+def test_reimport_skips_unchanged_rows(
+    tmp_path: Path, db_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    csv_path = _write_csv(tmp_path / "movies.csv", ROWS)
+    _import(csv_path, db_path)
+    before = _snapshot(db_path)
+    capsys.readouterr()
+
+    _import(csv_path, db_path)
+    out = capsys.readouterr().out
+    assert "Imported 0 movies" in out
+    assert "(3 unchanged)" in out
+    assert _snapshot(db_path) == before
+
+
+def test_reimport_of_edited_row_matches_forced_import(
+    tmp_path: Path, db_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    _import(_write_csv(tmp_path / "movies.csv", ROWS), db_path)
+    forced_db_path = tmp_path / "forced.db"
+    shutil.copy(db_path, forced_db_path)
+
+    edited = [list(row) for row in ROWS]
+    edited[1][5] = "Comedy, Romance"
+    edited[1][1] = "Beta Comedy"
+    edited_csv = _write_csv(tmp_path / "edited.csv", edited)
+    capsys.readouterr()
+
+    _import(edited_csv, db_path)
+    assert "Imported 1 movies" in capsys.readouterr().out
+    _import(edited_csv, forced_db_path, force=True)
+    assert "Imported 3 movies" in capsys.readouterr().out
+
+    snapshot = _snapshot(db_path)
+    assert snapshot == _snapshot(forced_db_path)
+    assert (2, "Comedy") in snapshot["genres"]
+    assert (2, "Drama") not in snapshot["genres"]
+
+
+def test_duplicate_ids_keep_the_last_row(tmp_path: Path, db_path: Path) -> None:
+    rows = ROWS + [["1", "Alpha Heist Redux", "Released", "", "", "Thriller", "", ""]]
+    csv_path = _write_csv(tmp_path / "movies.csv", rows)
+
+    # The second run is incremental; the duplicate must still win there
+    for _ in range(2):
+        _import(csv_path, db_path)
+        snapshot = _snapshot(db_path)
+        assert snapshot["movies"][0][:2] == (1, "Alpha Heist Redux")
+        assert [g for g in snapshot["genres"] if g[0] == 1] == [(1, "Thriller")]
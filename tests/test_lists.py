@@ -1,43 +1,11 @@
 from __future__ import annotations
 
-from typing import Generator
-
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
-
-from app.api.deps import get_db
-from app.database import Base
-from app.main import app
-
-SQLALCHEMY_TEST_DATABASE_URL = "sqlite:///./test_movies.db"
-
-engine = create_engine(
-    SQLALCHEMY_TEST_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-)
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-
-def override_get_db() -> Generator[Session, None, None]:
-    db = TestingSessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
-app.dependency_overrides[get_db] = override_get_db
-
-Base.metadata.drop_all(bind=engine)
-Base.metadata.create_all(bind=engine)
-
-client = TestClient(app)
 
 API_KEY_HEADERS = {"X-API-Key": "dev-secret-key"}
 
 
-def test_create_and_read_movie_list() -> None:
+def test_create_and_read_movie_list(client: TestClient) -> None:
     # First create a couple of movies to reference by title
     client.post(
         "/movies",
@@ -76,7 +44,7 @@ def test_create_and_read_movie_list() -> None:
     assert len(single_data["movies"]) == 2
 
 
-def test_update_and_delete_movie_list() -> None:
+def test_update_and_delete_movie_list(client: TestClient) -> None:
     client.post(
         "/movies",
         json={"title": "Movie A", "status": "released"},
@@ -126,3 +94,41 @@ def test_update_and_delete_movie_list() -> None:
     resp_not_found = client.get("/lists/My List")
     assert resp_not_found.status_code == 404
 
+
+def test_list_titles_match_case_insensitively(client: TestClient) -> None:
+    client.post(
+        "/movies",
+        json={"title": "Case Sensitive Movie", "status": "released"},
+        headers=API_KEY_HEADERS,
+    )
+
+    resp = client.post(
+        "/lists",
+        json={"name": "Case List", "movie_titles": ["case SENSITIVE movie"]},
+        headers=API_KEY_HEADERS,
+    )
+    assert resp.status_code == 201
+    data = resp.json()
+    assert [m["title"] for m in data["movies"]] == ["Case Sensitive Movie"]
+
+
+def test_list_summaries_report_sizes(client: TestClient) -> None:
+    client.post(
+        "/movies",
+        json={"title": "Summary Movie", "status": "released"},
+        headers=API_KEY_HEADERS,
+    )
+    client.post(
+        "/lists",
+        json={"name": "Summary List", "movie_titles": ["Summary Movie"]},
+        headers=API_KEY_HEADERS,
+    )
+    client.post(
+        "/lists",
+        json={"name": "Empty Summary List", "movie_titles": []},
+        headers=API_KEY_HEADERS,
+    )
+
+    sizes = {l["name"]: l["size"] for l in client.get("/lists").json()}
+    assert sizes["Summary List"] == 1
+    assert sizes["Empty Summary List"] == 0
@@ -1,44 +1,42 @@
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Generator
 
+import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateTable
 
-from app.api.deps import get_db
-from app.database import Base
-from app.main import app
+from app.core.cache import response_cache
+from app.crud.movie import get_movies, get_movies_by_title, rebuild_movie_tokens
+from app.database import Base, init_db
 from app.models.movie import Movie
 
-SQLALCHEMY_TEST_DATABASE_URL = "sqlite:///./test_movies.db"
-
-engine = create_engine(
-    SQLALCHEMY_TEST_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-)
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-
-def override_get_db() -> Generator[Session, None, None]:
-    db = TestingSessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
-app.dependency_overrides[get_db] = override_get_db
-
-Base.metadata.drop_all(bind=engine)
-Base.metadata.create_all(bind=engine)
+API_KEY_HEADERS = {"X-API-Key": "dev-secret-key"}
 
-client = TestClient(app)
 
-API_KEY_HEADERS = {"X-API-Key": "dev-secret-key"}
+@pytest.fixture
+def seed_movies(db_session: Session) -> Generator[None, None, None]:
+    """Insert the movies the lookup tests query, bypassing the HTTP layer."""
+    db_session.execute(
+        insert(Movie),
+        [
+            {"title": "The Matrix", "status": "released"},
+            {"title": "Action Movie", "status": "released", "genres": "Action, Thriller"},
+            {"title": "Drama Movie", "status": "released", "genres": "Drama, Romance"},
+            {"title": "High Rated Movie", "status": "released", "vote_average": 9.0},
+            {"title": "Medium Rated Movie", "status": "released", "vote_average": 7.0},
+            {"title": "Low Rated Movie", "status": "released", "vote_average": 5.0},
+        ],
+    )
+    rebuild_movie_tokens(db_session)
+    db_session.commit()
+    yield
 
 
-def test_create_movie() -> None:
+def test_create_movie(client: TestClient) -> None:
     payload = {
         "title": "Inception",
         "status": "released",
@@ -52,14 +50,7 @@ def test_create_movie() -> None:
     assert "id" in data
 
 
-def test_get_movies_by_title() -> None:
-    # create movie first
-    payload = {
-        "title": "The Matrix",
-        "status": "released",
-    }
-    client.post("/movies", json=payload, headers=API_KEY_HEADERS)
-
+def test_get_movies_by_title(client: TestClient, seed_movies: None) -> None:
     # Test partial match
     resp = client.get("/movies/by-title/Matrix")
     assert resp.status_code == 200
@@ -78,29 +69,28 @@ def test_get_movies_by_title() -> None:
     # Test not found
     resp_not_found = client.get("/movies/by-title/NonexistentMovie12345")
     assert resp_not_found.status_code == 404
+    assert resp_not_found.json() == {
+        "detail": "No movies found with title 'NonexistentMovie12345'"
+    }
 
 
-def test_get_movies_by_genre() -> None:
-    # create movies with genres
-    client.post(
-        "/movies",
-        json={
-            "title": "Action Movie",
-            "status": "released",
-            "genres": "Action, Thriller",
-        },
-        headers=API_KEY_HEADERS,
-    )
+def test_title_search_matches_any_case_and_short_substrings(client: TestClient) -> None:
     client.post(
         "/movies",
-        json={
-            "title": "Drama Movie",
-            "status": "released",
-            "genres": "Drama, Romance",
-        },
+        json={"title": "Zephyr Quest", "status": "released"},
         headers=API_KEY_HEADERS,
     )
 
+    for query in ("pHYR qu", "Z", "ue"):
+        resp = client.get(f"/movies/by-title/{query}")
+        assert resp.status_code == 200
+        assert any(m["title"] == "Zephyr Quest" for m in resp.json())
+
+    titles = [m["title"] for m in client.get("/movies", params={"title": "yr que"}).json()["items"]]
+    assert "Zephyr Quest" in titles
+
+
+def test_get_movies_by_genre(client: TestClient, seed_movies: None) -> None:
     resp = client.get("/movies/by-genre/Action")
     assert resp.status_code == 200
     data = resp.json()
@@ -110,36 +100,7 @@ def test_get_movies_by_genre() -> None:
     assert any("Action" in m.get("genres", "") for m in data["items"])
 
 
-def test_get_movies_by_rating() -> None:
-    # create movies with different ratings
-    client.post(
-        "/movies",
-        json={
-            "title": "High Rated Movie",
-            "status": "released",
-            "vote_average": 9.0,
-        },
-        headers=API_KEY_HEADERS,
-    )
-    client.post(
-        "/movies",
-        json={
-            "title": "Medium Rated Movie",
-            "status": "released",
-            "vote_average": 7.0,
-        },
-        headers=API_KEY_HEADERS,
-    )
-    client.post(
-        "/movies",
-        json={
-            "title": "Low Rated Movie",
-            "status": "released",
-            "vote_average": 5.0,
-        },
-        headers=API_KEY_HEADERS,
-    )
-
+def test_get_movies_by_rating(client: TestClient, seed_movies: None) -> None:
     # Test min rating
     resp = client.get("/movies/by-rating", params={"min_rating": 7.0})
     assert resp.status_code == 200
@@ -162,7 +123,7 @@ def test_get_movies_by_rating() -> None:
     assert resp_error.status_code == 422
 
 
-def test_list_movies_pagination() -> None:
+def test_list_movies_pagination(client: TestClient) -> None:
     # ensure there are some movies
     for i in range(3):
         client.post(
@@ -191,3 +152,158 @@ def test_list_movies_pagination() -> None:
     assert "items" in data_genre
 
 
+def test_list_movies_cursor_pagination(client: TestClient) -> None:
+    for i in range(3):
+        client.post(
+            "/movies",
+            json={"title": f"Cursor Movie {i}", "status": "released"},
+            headers=API_KEY_HEADERS,
+        )
+
+    first = client.get("/movies", params={"limit": 2}).json()
+    assert len(first["items"]) == 2
+    assert first["next_cursor"] == first["items"][-1]["id"]
+
+    second = client.get(
+        "/movies", params={"limit": 2, "after_id": first["next_cursor"]}
+    ).json()
+    assert all(m["id"] > first["next_cursor"] for m in second["items"])
+    ids = [m["id"] for m in second["items"]]
+    assert ids == sorted(ids)
+
+
+def test_list_movies_total_is_opt_in(client: TestClient) -> None:
+    for i in range(3):
+        client.post(
+            "/movies",
+            json={"title": f"Total Movie {i}", "status": "released"},
+            headers=API_KEY_HEADERS,
+        )
+
+    data = client.get("/movies", params={"limit": 1}).json()
+    assert data["total"] is None
+    assert data["has_more"] is True
+
+    data_total = client.get(
+        "/movies", params={"limit": 1, "include_total": True}
+    ).json()
+    assert data_total["total"] >= 3
+
+
+def test_similar_movies_by_title(client: TestClient) -> None:
+    movies = [
+        {"title": "Similar Ref", "genres": "War, Drama", "keywords": "soldier, battle"},
+        {"title": "Similar Close", "genres": "War, Drama", "keywords": "battle", "vote_average": 6.0},
+        {"title": "Similar Partial", "genres": "Drama", "vote_average": 8.0},
+        {"title": "Similar Substring", "genres": "Warrior Tales", "keywords": "soldiers"},
+    ]
+    for m in movies:
+        client.post(
+            "/movies", json={"status": "released", **m}, headers=API_KEY_HEADERS
+        )
+
+    resp = client.get("/movies/by-title/Similar Ref/similar")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["reference_title"] == "Similar Ref"
+    titles = [m["title"] for m in data["items"]]
+    # Whole-token matching only, sorted by rating first
+    assert "Similar Substring" not in titles
+    assert titles.index("Similar Partial") < titles.index("Similar Close")
+    close = next(m for m in data["items"] if m["title"] == "Similar Close")
+    assert close["shared_genres"] == ["Drama", "War"]
+    assert close["shared_keywords"] == ["battle"]
+    assert close["similarity_score"] == 5
+
+
+def test_list_movies_status_filter_is_normalised(client: TestClient) -> None:
+    client.post(
+        "/movies",
+        json={"title": "Unreleased Status Movie", "status": "not released"},
+        headers=API_KEY_HEADERS,
+    )
+
+    resp = client.get("/movies", params={"status": " Not Released ", "limit": 100})
+    assert resp.status_code == 200
+    titles = [m["title"] for m in resp.json()["items"]]
+    assert "Unreleased Status Movie" in titles
+    assert "Inception" not in titles
+
+
+def test_cached_listing_is_refreshed_after_write(client: TestClient) -> None:
+    params = {"min_rating": 9.9, "limit": 100}
+    before = client.get("/movies/by-rating", params=params).json()
+    assert client.get("/movies/by-rating", params=params).json() == before
+
+    client.post(
+        "/movies",
+        json={"title": "Cache Buster", "status": "released", "vote_average": 9.95},
+        headers=API_KEY_HEADERS,
+    )
+
+    after = client.get("/movies/by-rating", params=params).json()
+    assert any(m["title"] == "Cache Buster" for m in after["items"])
+
+
+def test_cache_drops_body_read_before_a_write() -> None:
+    generation = response_cache.generation
+    # A write commits and clears while the read is still building its body
+    response_cache.clear()
+    response_cache.set("/movies?", b"stale", generation)
+    assert response_cache.get("/movies?") is None
+
+    response_cache.set("/movies?", b"fresh", response_cache.generation)
+    assert response_cache.get("/movies?") == b"fresh"
+
+
+def test_stream_movies_returns_all_matches(client: TestClient) -> None:
+    for i in range(3):
+        client.post(
+            "/movies",
+            json={"title": f"Streamed Movie {i}", "status": "released"},
+            headers=API_KEY_HEADERS,
+        )
+
+    resp = client.get("/movies/stream", params={"title": "Streamed Movie"})
+    assert resp.status_code == 200
+    items = resp.json()["items"]
+    assert [m["title"] for m in items] == [f"Streamed Movie {i}" for i in range(3)]
+    assert set(items[0]) == {"id", "title", "vote_average", "release_date", "poster_path"}
+
+
+def test_init_db_links_genres_of_existing_movies(tmp_path: Path) -> None:
+    # A database from before the genre/keyword tables: movies, but no links
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    Base.metadata.create_all(bind=engine)
+    with Session(bind=engine) as db:
+        db.execute(
+            insert(Movie),
+            [
+                {"title": "Legacy Action", "genres": "Action, Drama"},
+                {"title": "Legacy Comedy", "genres": "Comedy"},
+            ],
+        )
+        db.commit()
+
+    init_db(bind=engine)
+
+    with Session(bind=engine) as db:
+        movies, _, _ = get_movies(db, genre="Action")
+        assert [m.title for m in movies] == ["Legacy Action"]
+    engine.dispose()
+
+
+def test_exact_title_match_ignores_case_without_nocase_column(tmp_path: Path) -> None:
+    # create_all never alters existing columns, so older databases keep a
+    # BINARY title column
+    engine = create_engine(f"sqlite:///{tmp_path / 'binary_title.db'}")
+    ddl = str(CreateTable(Movie.__table__).compile(engine)).replace(' COLLATE "NOCASE"', "")
+    assert "NOCASE" not in ddl
+    with engine.begin() as conn:
+        conn.exec_driver_sql(ddl)
+        conn.execute(insert(Movie), [{"title": "Inception"}])
+
+    with Session(bind=engine) as db:
+        movies = get_movies_by_title(db, "inception", exact=True)
+        assert [m.title for m in movies] == ["Inception"]
+    engine.dispose()